@@ -5,11 +5,15 @@ from pydantic import BaseModel, Field
 from agent.state import State
 from agent.tools import sales_tools, tech_support_tools, order_inquiry_tools
 
-llm = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash",
-    api_key=os.getenv("GEMINI_API_KEY"),
-    temperature=0.7
-)
+if os.getenv("AGENT_LLM") == "stub":
+    from agent.stub_llm import StubLLM
+    llm = StubLLM()
+else:
+    llm = ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        api_key=os.getenv("GEMINI_API_KEY"),
+        temperature=0.7
+    )
 
 MAX_HISTORY_MESSAGES = 20
 def get_recent_messages(messages: list[BaseMessage]) -> list[BaseMessage]:
@@ -115,7 +119,10 @@ If customer is unsatisfied, wants human support, or issue requires physical repa
     return {"messages": [response], "next_action": next_action}
 
 def order_inquiry_node(state: State) -> dict:
-    system_msg = """You are an order support specialist. Use get_order_details and get_customer_orders tools.
+    system_msg = """You are an order support specialist. Use get_order_details, get_customer_order_summary and get_customer_orders tools.
+
+For questions about how many orders a customer has, how much they have spent, or their latest order, use get_customer_order_summary.
+Only use get_customer_orders when the customer needs to see a list of their orders.
 
 Review the conversation history to understand what information has already been provided. Reference the order details already discussed.
 
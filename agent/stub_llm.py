@@ -0,0 +1,80 @@
+import os
+import re
+import time
+import uuid
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage, BaseMessage
+
+ROUTE_KEYWORDS = [
+    ("escalation", ("refund", "cancel", "complaint", "manager", "human")),
+    ("order_inquiry", ("order", "tracking", "shipped", "delivery", "spent")),
+    ("tech_support", ("not working", "broken", "error", "issue", "problem", "crash", "fix")),
+]
+
+ID_PATTERNS = {
+    "order_id": re.compile(r"\bORD[0-9A-F]{6,}\b", re.IGNORECASE),
+    "customer_id": re.compile(r"\bCUST\d+\b", re.IGNORECASE),
+    "product_id": re.compile(r"\b[A-Z]{2,3}-\d{3,}\b"),
+}
+
+TOOL_FOR_ID = [
+    ("order_id", "get_order_details"),
+    ("customer_id", "get_customer_order_summary"),
+    ("product_id", "get_product_info"),
+    ("product_id", "get_technical_issues"),
+]
+
+def extract_ids(text: str) -> dict:
+    ids = {}
+    for name, pattern in ID_PATTERNS.items():
+        match = pattern.search(text)
+        ids[name] = match.group(0).upper() if match else None
+    return ids
+
+class StubLLM:
+    def __init__(self, tool_names: list[str] = None, schema=None, latency: float = None):
+        self.tool_names = tool_names or []
+        self.schema = schema
+        self.latency = latency if latency is not None else float(os.getenv("AGENT_STUB_LATENCY", "0"))
+
+    def with_structured_output(self, schema):
+        return StubLLM(schema=schema, latency=self.latency)
+
+    def bind_tools(self, tools):
+        return StubLLM(tool_names=[t.name for t in tools], latency=self.latency)
+
+    def invoke(self, messages: list[BaseMessage]):
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.schema:
+            return self._route(messages)
+        return self._respond(messages)
+
+    def _route(self, messages: list[BaseMessage]):
+        query = messages[-1].content.lower()
+        category = next(
+            (route for route, keywords in ROUTE_KEYWORDS if any(k in query for k in keywords)),
+            "sales"
+        )
+        return self.schema(category=category, **extract_ids(messages[-1].content))
+
+    def _respond(self, messages: list[BaseMessage]):
+        last_msg = messages[-1]
+
+        if isinstance(last_msg, ToolMessage):
+            return AIMessage(content=f"Here is what I found: {last_msg.content[:500]}")
+
+        if isinstance(last_msg, HumanMessage):
+            ids = extract_ids(last_msg.content)
+            for id_name, tool_name in TOOL_FOR_ID:
+                if ids[id_name] and tool_name in self.tool_names:
+                    return AIMessage(
+                        content="",
+                        tool_calls=[{
+                            "name": tool_name,
+                            "args": {id_name: ids[id_name]},
+                            "id": f"call_{uuid.uuid4().hex[:12]}"
+                        }]
+                    )
+
+        return AIMessage(content="Thanks for reaching out. Could you share a few more details so I can help?")
@@ -12,7 +12,7 @@ def get_customer_info(customer_id: str) -> dict:
     Returns:
         Customer information including name, email, phone, and loyalty tier
     """
-    with get_db_session() as session:
+    with get_db_session(read_only=True, consistency_keys=(customer_id,)) as session:
         service = CustomerService(session)
         result = service.get_customer_info(customer_id)
         return result if result else {"error": "Customer not found"}
@@ -25,7 +25,7 @@ def get_product_info(product_id: str) -> dict:
     Returns:
         Product details including name, description, price, stock, and specifications
     """
-    with get_db_session() as session:
+    with get_db_session(read_only=True, consistency_keys=(product_id,)) as session:
         service = ProductService(session)
         result = service.get_product_info(product_id)
         return result if result else {"error": "Product not found"}
@@ -39,7 +39,7 @@ def search_products(category: str = None, keyword: str = None) -> list[dict]:
     Returns:
         List of products matching the search criteria
     """
-    with get_db_session() as session:
+    with get_db_session(read_only=True) as session:
         service = ProductService(session)
         return service.search_products(category=category, keyword=keyword)
 
@@ -51,7 +51,7 @@ def get_technical_issues(product_id: str = None) -> list[dict]:
     Returns:
         List of technical issues with descriptions and solutions
     """
-    with get_db_session() as session:
+    with get_db_session(read_only=True) as session:
         service = ProductService(session)
         return service.get_technical_issues(product_id=product_id)
 
@@ -63,7 +63,7 @@ def get_order_details(order_id: str) -> dict:
     Returns:
         Order details including status, items, total amount, and shipping information
     """
-    with get_db_session() as session:
+    with get_db_session(read_only=True, consistency_keys=(order_id,)) as session:
         service = OrderService(session)
         result = service.get_order_details(order_id)
         return result if result else {"error": "Order not found"}
@@ -76,10 +76,23 @@ def get_customer_orders(customer_id: str) -> list[dict]:
     Returns:
         List of customer's orders with basic information
     """
-    with get_db_session() as session:
+    with get_db_session(read_only=True, consistency_keys=(customer_id,)) as session:
         service = OrderService(session)
         return service.get_customer_orders(customer_id)
 
+@tool
+def get_customer_order_summary(customer_id: str) -> dict:
+    """Get a precomputed summary of a customer's orders.
+    Args:
+        customer_id: The unique customer identifier (e.g., 'CUST001')
+    Returns:
+        Order count overall and by status, lifetime spend, and the latest order's ID, date and status
+    """
+    with get_db_session(read_only=True, consistency_keys=(customer_id,)) as session:
+        service = OrderService(session)
+        result = service.get_customer_order_summary(customer_id)
+        return result if result else {"error": "Customer not found"}
+
 @tool
 def place_order(customer_id: str, items: list[dict], shipping_address: str) -> dict:
     """Place a new order for a customer.
@@ -96,5 +109,5 @@ def place_order(customer_id: str, items: list[dict], shipping_address: str) -> d
 
 sales_tools = [search_products, get_product_info, get_customer_info, place_order]
 tech_support_tools = [get_product_info, get_technical_issues]
-order_inquiry_tools = [get_order_details, get_customer_orders]
+order_inquiry_tools = [get_order_details, get_customer_order_summary, get_customer_orders]
 tools = sales_tools + tech_support_tools + order_inquiry_tools
\ No newline at end of file
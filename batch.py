@@ -0,0 +1,255 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from multiprocessing import get_context
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
+
+graph = None
+engine_metrics = None
+
+def init_worker():
+    global graph, engine_metrics
+    from agent.agent import graph as worker_graph
+    from core.database import get_engine_metrics
+    graph = worker_graph
+    engine_metrics = get_engine_metrics
+
+def worker_ready() -> int:
+    time.sleep(0.1)
+    return os.getpid()
+
+def process_ticket(ticket: dict) -> tuple[dict, int, dict]:
+    started = time.perf_counter()
+    result = {"ticket_id": ticket["ticket_id"]}
+
+    state = {
+        "messages": [],
+        "customer_query": ticket["query"],
+        "order_id": ticket.get("order_id"),
+        "customer_id": ticket.get("customer_id"),
+        "product_id": ticket.get("product_id"),
+        "next_action": None
+    }
+
+    try:
+        final_state = graph.invoke(state)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    else:
+        result.update({
+            "route": final_state.get("next_action"),
+            "escalated": final_state.get("next_action") == "escalation",
+            "response": final_state["messages"][-1].content,
+            "order_id": final_state.get("order_id"),
+            "customer_id": final_state.get("customer_id"),
+            "product_id": final_state.get("product_id")
+        })
+
+    result["elapsed"] = round(time.perf_counter() - started, 3)
+    return result, os.getpid(), engine_metrics()
+
+def iter_tickets(source: Path):
+    files = sorted(source.glob("*.jsonl")) if source.is_dir() else [source]
+
+    for path in files:
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    ticket = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"Skipping invalid JSON at {path}:{line_number}", file=sys.stderr)
+                    continue
+                if not isinstance(ticket, dict):
+                    print(f"Skipping non-object JSON at {path}:{line_number}", file=sys.stderr)
+                    continue
+                if not ticket.get("query"):
+                    print(f"Skipping ticket without query at {path}:{line_number}", file=sys.stderr)
+                    continue
+                ticket.setdefault("ticket_id", f"{path.name}:{line_number}")
+                yield ticket
+
+def load_checkpoint(output: Path) -> set[str]:
+    if not output.exists():
+        return set()
+
+    data = output.read_bytes()
+    partial = bool(data) and not data.endswith(b"\n")
+    lines = data[:data.rfind(b"\n") + 1].splitlines()
+
+    latest = {}
+    kept = 0
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict) or "ticket_id" not in record:
+            print(f"Dropping unreadable checkpoint record at {output}:{line_number}", file=sys.stderr)
+            continue
+        kept += 1
+        latest.pop(record["ticket_id"], None)
+        latest[record["ticket_id"]] = (line, "error" in record)
+
+    if partial or len(latest) != kept or kept != len(lines):
+        compacted = output.with_name(output.name + ".tmp")
+        compacted.write_bytes(b"".join(line + b"\n" for line, _ in latest.values()))
+        os.replace(compacted, output)
+
+    return {ticket_id for ticket_id, (_, failed) in latest.items() if not failed}
+
+def merge_engine_metrics(snapshots) -> dict:
+    engines, fallbacks = {}, {}
+
+    for snapshot in snapshots:
+        for name, metrics in snapshot["engines"].items():
+            total = engines.setdefault(name, {"sessions": 0, "queries": 0, "errors": 0, "lag": None})
+            for key in ("sessions", "queries", "errors"):
+                total[key] += metrics[key]
+            if metrics["lag"] is not None:
+                total["lag"] = max(total["lag"] or 0.0, metrics["lag"])
+        for reason, count in snapshot["fallbacks"].items():
+            fallbacks[reason] = fallbacks.get(reason, 0) + count
+
+    return {"engines": engines, "fallbacks": fallbacks}
+
+def report_engine_metrics(metrics: dict):
+    print("Database engines:")
+    for name, engine in metrics["engines"].items():
+        lag = f", lag {engine['lag']:.1f}s" if engine["lag"] is not None else ""
+        print(f"  {name}: {engine['sessions']:,} sessions, {engine['queries']:,} queries, {engine['errors']:,} errors{lag}")
+    if metrics["fallbacks"]:
+        print("  replica fallbacks: " + ", ".join(f"{reason} {count:,}" for reason, count in metrics["fallbacks"].items()))
+
+class RateLimiter:
+    def __init__(self, rate: float | None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_time = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        if self.next_time > now:
+            time.sleep(self.next_time - now)
+        self.next_time = max(now, self.next_time) + self.interval
+
+class Progress:
+    def __init__(self, report_interval: float):
+        self.report_interval = report_interval
+        self.started = time.perf_counter()
+        self.last_report = self.started
+        self.processed = 0
+        self.errors = 0
+
+    def record(self, result: dict):
+        self.processed += 1
+        if "error" in result:
+            self.errors += 1
+
+    def due(self) -> bool:
+        return time.perf_counter() - self.last_report >= self.report_interval
+
+    def report(self, label: str = "Progress"):
+        self.last_report = time.perf_counter()
+        elapsed = self.last_report - self.started
+        rate = self.processed / elapsed if elapsed else 0.0
+        print(f"{label}: {self.processed:,} tickets ({self.errors:,} errors) in {elapsed:.1f}s, {rate:.2f} tickets/s")
+
+def run(source: Path, output: Path, workers: int, max_in_flight: int, rate: float | None, limit: int | None, report_interval: float) -> Progress:
+    completed = load_checkpoint(output)
+    if completed:
+        print(f"Resuming: {len(completed):,} tickets already processed")
+
+    tickets = (t for t in iter_tickets(source) if t["ticket_id"] not in completed)
+    if limit is not None:
+        tickets = islice(tickets, limit)
+
+    limiter = RateLimiter(rate)
+
+    with open(output, "a", encoding="utf-8") as out, ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=init_worker
+    ) as pool:
+        started = time.perf_counter()
+        ready = {future.result() for future in [pool.submit(worker_ready) for _ in range(workers)]}
+        print(f"Initialized {len(ready)} of {workers} workers in {time.perf_counter() - started:.1f}s")
+
+        progress = Progress(report_interval)
+        worker_metrics = {}
+        pending = set()
+
+        def drain(return_when: str):
+            nonlocal pending
+            done, pending = wait(pending, return_when=return_when)
+            for future in done:
+                result, pid, metrics = future.result()
+                worker_metrics[pid] = metrics
+                out.write(json.dumps(result, default=str) + "\n")
+                progress.record(result)
+            out.flush()
+            if progress.due():
+                os.fsync(out.fileno())
+                progress.report()
+
+        for ticket in tickets:
+            while len(pending) >= max_in_flight:
+                drain(FIRST_COMPLETED)
+            limiter.wait()
+            pending.add(pool.submit(process_ticket, ticket))
+
+        while pending:
+            drain(FIRST_COMPLETED)
+
+        os.fsync(out.fileno())
+
+    progress.report("Finished")
+    if worker_metrics:
+        report_engine_metrics(merge_engine_metrics(worker_metrics.values()))
+    return progress
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a backlog of support tickets through the agent graph.")
+    parser.add_argument("source", type=Path, help="JSONL file of tickets, or a directory of *.jsonl files")
+    parser.add_argument("output", type=Path, help="JSONL results file; rerunning with the same file resumes, retrying failed tickets and keeping only the latest record per ticket")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-in-flight", type=int, help="Tickets queued at once (defaults to workers * 2)")
+    parser.add_argument("--rate", type=float, help="Maximum tickets started per second across all workers")
+    parser.add_argument("--limit", type=int, help="Process at most this many remaining tickets")
+    parser.add_argument("--report-interval", type=float, default=10.0, help="Seconds between progress reports")
+    parser.add_argument("--stub-llm", action="store_true", help="Use the offline stub model instead of Gemini")
+    parser.add_argument("--stub-latency", type=float, default=0.0, help="Simulated seconds per stub model call")
+    args = parser.parse_args()
+
+    if not args.source.exists():
+        parser.error(f"{args.source} does not exist")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.stub_llm:
+        os.environ["AGENT_LLM"] = "stub"
+        os.environ["AGENT_STUB_LATENCY"] = str(args.stub_latency)
+
+    run(
+        args.source,
+        args.output,
+        workers=args.workers,
+        max_in_flight=args.max_in_flight or args.workers * 2,
+        rate=args.rate,
+        limit=args.limit,
+        report_interval=args.report_interval
+    )
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,170 @@
 import os
-from sqlalchemy import create_engine
+import threading
+import time
+from itertools import count
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from contextlib import contextmanager
 
-DATABASE_URL = f"mysql+mysqlconnector://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+DATABASE_URL = os.getenv("DATABASE_URL") or f"mysql+mysqlconnector://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+REPLICA_MAX_LAG = float(os.getenv("REPLICA_MAX_LAG", "5"))
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", "5"))
 
 engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
+replica_engines = [create_engine(url, echo=False, pool_pre_ping=True) for url in REPLICA_URLS]
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+class EngineMetrics:
+    def __init__(self, name: str, engine):
+        self.name = name
+        self.lock = threading.Lock()
+        self.sessions = 0
+        self.queries = 0
+        self.errors = 0
+        self.lag = None
+        self.lag_checked = False
+
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine, "handle_error", self._on_error)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        with self.lock:
+            self.queries += 1
+
+    def _on_error(self, exception_context):
+        with self.lock:
+            self.errors += 1
+
+    def record_session(self):
+        with self.lock:
+            self.sessions += 1
+
+    def snapshot(self) -> dict:
+        return {"sessions": self.sessions, "queries": self.queries, "errors": self.errors, "lag": self.lag}
+
+def measure_replica_lag(replica) -> float | None:
+    if replica.dialect.name != "mysql":
+        return 0.0
+
+    with replica.connect() as connection:
+        try:
+            row = connection.execute(text("SHOW REPLICA STATUS")).mappings().first()
+        except Exception:
+            row = connection.execute(text("SHOW SLAVE STATUS")).mappings().first()
+
+    if row is None:
+        return None
+
+    lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+    return float(lag) if lag is not None else None
+
+class ReplicaRouter:
+    def __init__(self, primary, replicas: list, max_lag: float, lag_check_interval: float):
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self.write_window = max_lag + lag_check_interval
+        self.lock = threading.Lock()
+        self.recent_writes = {}
+        self.monitor_pid = None
+        self.turn = count()
+        self.fallbacks = {"read_your_writes": 0, "replica_lag": 0, "lag_unknown": 0}
+
+        self.metrics = {primary: EngineMetrics("primary", primary)}
+        for index, replica in enumerate(replicas):
+            self.metrics[replica] = EngineMetrics(f"replica-{index}", replica)
+
+    def record_writes(self, *keys: str):
+        now = time.monotonic()
+        with self.lock:
+            for key in keys:
+                if key:
+                    self.recent_writes[key] = now
+            if len(self.recent_writes) > 10_000:
+                self.recent_writes = {
+                    k: written_at for k, written_at in self.recent_writes.items()
+                    if now - written_at < self.write_window
+                }
+
+    def recently_written(self, keys) -> bool:
+        now = time.monotonic()
+        with self.lock:
+            return any(
+                now - self.recent_writes.get(key, float("-inf")) < self.write_window
+                for key in keys if key
+            )
+
+    def check_lag(self):
+        for replica in self.replicas:
+            try:
+                lag = measure_replica_lag(replica)
+            except Exception:
+                lag = None
+            self.metrics[replica].lag = lag
+            self.metrics[replica].lag_checked = True
+
+    def _monitor_lag(self):
+        while True:
+            self.check_lag()
+            time.sleep(self.lag_check_interval)
+
+    def _ensure_monitor(self):
+        if self.monitor_pid == os.getpid():
+            return
+        with self.lock:
+            if self.monitor_pid != os.getpid():
+                self.monitor_pid = os.getpid()
+                threading.Thread(target=self._monitor_lag, name="replica-lag-monitor", daemon=True).start()
+
+    def replica_healthy(self, replica) -> bool:
+        lag = self.metrics[replica].lag
+        return lag is not None and lag <= self.max_lag
+
+    def count_fallback(self, reason: str):
+        with self.lock:
+            self.fallbacks[reason] += 1
+
+    def choose(self, consistency_keys=()):
+        if not self.replicas:
+            return self.primary
+
+        self._ensure_monitor()
+
+        if self.recently_written(consistency_keys):
+            self.count_fallback("read_your_writes")
+            return self.primary
+
+        start = next(self.turn)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if self.replica_healthy(replica):
+                return replica
+
+        if any(self.metrics[replica].lag_checked for replica in self.replicas):
+            self.count_fallback("replica_lag")
+        else:
+            self.count_fallback("lag_unknown")
+        return self.primary
+
+    def snapshot(self) -> dict:
+        engines = {metrics.name: metrics.snapshot() for metrics in self.metrics.values()}
+        return {"engines": engines, "fallbacks": dict(self.fallbacks)}
+
+router = ReplicaRouter(engine, replica_engines, REPLICA_MAX_LAG, REPLICA_LAG_CHECK_INTERVAL)
+
+def record_writes(*keys: str):
+    router.record_writes(*keys)
+
+def get_engine_metrics() -> dict:
+    return router.snapshot()
+
 @contextmanager
-def get_db_session():
-    session = SessionLocal()
+def get_db_session(read_only: bool = False, consistency_keys: tuple = ()):
+    bind = router.choose(consistency_keys) if read_only else engine
+    router.metrics[bind].record_session()
+    session = SessionLocal(bind=bind)
     yield session
-    session.close()
\ No newline at end of file
+    session.close()
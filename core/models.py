@@ -34,6 +34,7 @@ class Customer(Base):
     loyalty_tier = Column(Enum(LoyaltyTier), default=LoyaltyTier.Bronze)
     
     orders = relationship("Order", back_populates="customer")
+    order_summary = relationship("CustomerOrderSummary", back_populates="customer", uselist=False)
 
 class Product(Base):
     __tablename__ = "products"
@@ -99,4 +100,25 @@ class OrderLog(Base):
     notes = Column(Text)
     timestamp = Column(TIMESTAMP, server_default=func.current_timestamp())
     
-    order = relationship("Order", back_populates="logs")
\ No newline at end of file
+    order = relationship("Order", back_populates="logs")
+
+# Kept current by OrderService.place_order and OrderService.update_order_status.
+# rebuild_summaries.py creates the table and backfills it; run it before
+# deploying code that places orders, and after any other write to orders.status.
+class CustomerOrderSummary(Base):
+    __tablename__ = "customer_order_summaries"
+    
+    customer_id = Column(String(50), ForeignKey("customers.customer_id"), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    pending_count = Column(Integer, nullable=False, default=0)
+    processing_count = Column(Integer, nullable=False, default=0)
+    shipped_count = Column(Integer, nullable=False, default=0)
+    delivered_count = Column(Integer, nullable=False, default=0)
+    cancelled_count = Column(Integer, nullable=False, default=0)
+    lifetime_spend = Column(DECIMAL(14, 2), nullable=False, default=0)
+    last_order_id = Column(String(50))
+    last_order_date = Column(TIMESTAMP)
+    last_order_status = Column(Enum(OrderStatus))
+    updated_at = Column(TIMESTAMP, server_default=func.current_timestamp(), onupdate=func.current_timestamp())
+    
+    customer = relationship("Customer", back_populates="order_summary")
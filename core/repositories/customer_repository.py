@@ -8,6 +8,14 @@ class CustomerRepository:
     def get_by_id(self, customer_id: str) -> Customer | None:
         return self.session.query(Customer).filter(Customer.customer_id == customer_id).first()
     
+    def lock(self, customer_id: str) -> Customer | None:
+        return (
+            self.session.query(Customer)
+            .filter(Customer.customer_id == customer_id)
+            .with_for_update()
+            .first()
+        )
+    
     def get_by_email(self, email: str) -> Customer | None:
         return self.session.query(Customer).filter(Customer.email == email).first()
     
@@ -13,6 +13,15 @@ class OrderRepository:
             .first()
         )
     
+    def get_for_update(self, order_id: str) -> Order | None:
+        return (
+            self.session.query(Order)
+            .filter(Order.order_id == order_id)
+            .with_for_update()
+            .populate_existing()
+            .first()
+        )
+    
     def get_by_customer(self, customer_id: str, limit: int = 20) -> list[Order]:
         return (
             self.session.query(Order)
@@ -0,0 +1,156 @@
+from decimal import Decimal
+from sqlalchemy import select, insert, delete, func, case, and_
+from sqlalchemy.orm import Session
+from core.models import Order, OrderStatus, CustomerOrderSummary
+
+STATUS_COLUMNS = {status: f"{status.value}_count" for status in OrderStatus}
+SUMMARY_COLUMNS = [
+    "customer_id",
+    "order_count",
+    *STATUS_COLUMNS.values(),
+    "lifetime_spend",
+    "last_order_id",
+    "last_order_date",
+    "last_order_status"
+]
+
+def counts_towards_spend(status: OrderStatus) -> bool:
+    return status != OrderStatus.cancelled
+
+class OrderSummaryRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_by_customer(self, customer_id: str) -> CustomerOrderSummary | None:
+        return (
+            self.session.query(CustomerOrderSummary)
+            .filter(CustomerOrderSummary.customer_id == customer_id)
+            .first()
+        )
+
+    def _get_for_update(self, customer_id: str) -> tuple[CustomerOrderSummary, bool]:
+        # Callers hold CustomerRepository.lock for this customer, so only one
+        # transaction can find the row missing and seed it from existing orders.
+        summary = (
+            self.session.query(CustomerOrderSummary)
+            .filter(CustomerOrderSummary.customer_id == customer_id)
+            .with_for_update()
+            .first()
+        )
+
+        if summary:
+            return summary, False
+
+        self.session.flush()
+        self.session.execute(
+            insert(CustomerOrderSummary).from_select(SUMMARY_COLUMNS, self._summary_rows(customer_id))
+        )
+        return self.get_by_customer(customer_id), True
+
+    def record_order(self, order: Order):
+        status = OrderStatus(order.status)
+        amount = Decimal(str(order.total_amount))
+        summary, created = self._get_for_update(order.customer_id)
+        if created:
+            return
+
+        self.session.refresh(order, ["order_date"])
+
+        summary.order_count += 1
+        column = STATUS_COLUMNS[status]
+        setattr(summary, column, getattr(summary, column) + 1)
+
+        if counts_towards_spend(status):
+            summary.lifetime_spend += amount
+
+        if summary.last_order_date is None or (order.order_date, order.order_id) > (summary.last_order_date, summary.last_order_id):
+            summary.last_order_id = order.order_id
+            summary.last_order_date = order.order_date
+            summary.last_order_status = status
+
+        self.session.flush()
+
+    def record_status_change(self, order: Order, previous_status: OrderStatus):
+        previous_status = OrderStatus(previous_status)
+        status = OrderStatus(order.status)
+        if previous_status == status:
+            return
+
+        amount = Decimal(str(order.total_amount))
+        summary, created = self._get_for_update(order.customer_id)
+        if created:
+            return
+
+        previous_column, column = STATUS_COLUMNS[previous_status], STATUS_COLUMNS[status]
+        setattr(summary, previous_column, getattr(summary, previous_column) - 1)
+        setattr(summary, column, getattr(summary, column) + 1)
+
+        if counts_towards_spend(previous_status) and not counts_towards_spend(status):
+            summary.lifetime_spend -= amount
+        elif counts_towards_spend(status) and not counts_towards_spend(previous_status):
+            summary.lifetime_spend += amount
+
+        if summary.last_order_id == order.order_id:
+            summary.last_order_status = status
+
+        self.session.flush()
+
+    def _summary_rows(self, customer_id: str = None):
+        orders = select(Order)
+        if customer_id:
+            orders = orders.filter(Order.customer_id == customer_id)
+        orders = orders.subquery()
+
+        totals = (
+            select(
+                orders.c.customer_id,
+                func.count().label("order_count"),
+                *[
+                    func.sum(case((orders.c.status == status, 1), else_=0)).label(column)
+                    for status, column in STATUS_COLUMNS.items()
+                ],
+                func.sum(
+                    case((orders.c.status != OrderStatus.cancelled, orders.c.total_amount), else_=0)
+                ).label("lifetime_spend")
+            )
+            .group_by(orders.c.customer_id)
+            .subquery()
+        )
+
+        ranked = (
+            select(
+                orders.c.customer_id,
+                orders.c.order_id,
+                orders.c.order_date,
+                orders.c.status,
+                func.row_number().over(
+                    partition_by=orders.c.customer_id,
+                    order_by=(orders.c.order_date.desc(), orders.c.order_id.desc())
+                ).label("position")
+            )
+            .subquery()
+        )
+
+        return (
+            select(
+                totals.c.customer_id,
+                totals.c.order_count,
+                *[totals.c[column] for column in STATUS_COLUMNS.values()],
+                totals.c.lifetime_spend,
+                ranked.c.order_id.label("last_order_id"),
+                ranked.c.order_date.label("last_order_date"),
+                ranked.c.status.label("last_order_status")
+            )
+            .join(ranked, and_(ranked.c.customer_id == totals.c.customer_id, ranked.c.position == 1))
+        )
+
+    def compute_for_customer(self, customer_id: str):
+        return self.session.execute(self._summary_rows(customer_id)).first()
+
+    def rebuild(self) -> int:
+        self.session.execute(delete(CustomerOrderSummary))
+        result = self.session.execute(
+            insert(CustomerOrderSummary).from_select(SUMMARY_COLUMNS, self._summary_rows())
+        )
+        self.session.flush()
+        return result.rowcount
@@ -4,6 +4,9 @@ import secrets
 from core.repositories.order_repository import OrderRepository
 from core.repositories.product_repository import ProductRepository
 from core.repositories.customer_repository import CustomerRepository
+from core.repositories.order_summary_repository import OrderSummaryRepository
+from core.models import OrderStatus
+from core.database import record_writes
 
 class OrderService:
     def __init__(self, session: Session):
@@ -11,6 +14,7 @@ class OrderService:
         self.order_repo = OrderRepository(session)
         self.product_repo = ProductRepository(session)
         self.customer_repo = CustomerRepository(session)
+        self.summary_repo = OrderSummaryRepository(session)
     
     def get_order_details(self, order_id: str) -> dict | None:
         order = self.order_repo.get_by_id(order_id)
@@ -53,8 +57,40 @@ class OrderService:
             for order in orders
         ]
     
+    def get_customer_order_summary(self, customer_id: str) -> dict | None:
+        summary = (
+            self.summary_repo.get_by_customer(customer_id)
+            or self.summary_repo.compute_for_customer(customer_id)
+        )
+        
+        if not summary:
+            if not self.customer_repo.get_by_id(customer_id):
+                return None
+            return {
+                "customer_id": customer_id,
+                "order_count": 0,
+                "orders_by_status": {status.value: 0 for status in OrderStatus},
+                "lifetime_spend": 0.0,
+                "last_order": None
+            }
+        
+        return {
+            "customer_id": summary.customer_id,
+            "order_count": summary.order_count,
+            "orders_by_status": {
+                status.value: getattr(summary, f"{status.value}_count")
+                for status in OrderStatus
+            },
+            "lifetime_spend": float(summary.lifetime_spend),
+            "last_order": {
+                "order_id": summary.last_order_id,
+                "order_date": summary.last_order_date,
+                "status": summary.last_order_status.value
+            } if summary.last_order_id else None
+        }
+    
     def place_order(self, customer_id: str, items: list[dict], shipping_address: str) -> dict:
-        customer = self.customer_repo.get_by_id(customer_id)
+        customer = self.customer_repo.lock(customer_id)
         if not customer:
             return {"error": "Customer not found"}
         
@@ -104,7 +140,10 @@ class OrderService:
             "notes": "Order placed via AI agent"
         })
         
+        self.summary_repo.record_order(order)
+        
         self.session.commit()
+        record_writes(customer_id, order_id, *(item['product_id'] for item in validated_items))
         
         return {
             "success": True,
@@ -112,4 +151,35 @@ class OrderService:
             "total_amount": total_amount,
             "status": "pending",
             "message": "Order placed successfully"
+        }
+    
+    def update_order_status(self, order_id: str, status: str, notes: str = None) -> dict:
+        if status not in OrderStatus.__members__:
+            return {"error": f"Invalid status {status}"}
+        
+        order = self.order_repo.get_by_id(order_id)
+        if not order:
+            return {"error": "Order not found"}
+        
+        self.customer_repo.lock(order.customer_id)
+        order = self.order_repo.get_for_update(order_id)
+        previous_status = order.status
+        order.status = OrderStatus[status]
+        
+        self.order_repo.add_log({
+            "order_id": order_id,
+            "status": status,
+            "notes": notes
+        })
+        
+        self.summary_repo.record_status_change(order, previous_status)
+        
+        self.session.commit()
+        record_writes(order.customer_id, order_id)
+        
+        return {
+            "success": True,
+            "order_id": order_id,
+            "previous_status": previous_status.value,
+            "status": status
         }
\ No newline at end of file
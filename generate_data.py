@@ -0,0 +1,307 @@
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import accumulate
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event, text
+
+load_dotenv()
+
+def database_url_override() -> str | None:
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--database-url")
+    return parser.parse_known_args()[0].database_url
+
+if __name__ == "__main__":
+    database_url = database_url_override()
+    if database_url:
+        os.environ["DATABASE_URL"] = database_url
+
+from core.database import Base, DATABASE_URL, SessionLocal
+from core.models import (
+    Customer,
+    Product,
+    Order,
+    OrderItem,
+    TechnicalIssue,
+    OrderLog,
+    CustomerOrderSummary,
+    LoyaltyTier,
+    OrderStatus,
+    Severity
+)
+from core.repositories.order_summary_repository import OrderSummaryRepository
+
+BASE_DATE = datetime(2026, 1, 1)
+HISTORY_DAYS = 3 * 365
+
+CATEGORIES = ["Laptops", "Phones", "Tablets", "Monitors", "Audio", "Cameras", "Accessories", "Networking", "Storage", "Wearables"]
+ADJECTIVES = ["Pro", "Max", "Lite", "Ultra", "Air", "Plus", "Mini", "Edge", "Prime", "Neo"]
+FIRST_NAMES = ["James", "Mary", "Wei", "Priya", "Ahmed", "Sofia", "Kenji", "Olga", "Carlos", "Amara", "Liam", "Fatima"]
+LAST_NAMES = ["Smith", "Garcia", "Chen", "Patel", "Khan", "Rossi", "Tanaka", "Ivanova", "Silva", "Okafor", "Murphy", "Haddad"]
+ISSUE_TITLES = ["Device does not power on", "Battery drains quickly", "Overheating under load", "Wi-Fi keeps disconnecting", "Screen flickers", "Firmware update fails", "No sound output", "Bluetooth pairing fails"]
+
+LOYALTY_WEIGHTS = {LoyaltyTier.Bronze: 60, LoyaltyTier.Silver: 25, LoyaltyTier.Gold: 11, LoyaltyTier.Platinum: 4}
+STATUS_WEIGHTS = {
+    OrderStatus.delivered: 62,
+    OrderStatus.shipped: 12,
+    OrderStatus.processing: 8,
+    OrderStatus.pending: 10,
+    OrderStatus.cancelled: 8
+}
+SEVERITY_WEIGHTS = {Severity.Low: 35, Severity.Medium: 40, Severity.High: 20, Severity.Critical: 5}
+ITEMS_PER_ORDER_WEIGHTS = [45, 25, 15, 8, 4, 2, 1]
+
+def zipf_cum_weights(n: int, exponent: float) -> list[float]:
+    return list(accumulate(1.0 / (rank + 1) ** exponent for rank in range(n)))
+
+def skewed_picker(rng: random.Random, n: int, exponent: float):
+    ranked = list(range(n))
+    rng.shuffle(ranked)
+    cum_weights = zipf_cum_weights(n, exponent)
+
+    def pick(k: int) -> list[int]:
+        return [ranked[i] for i in rng.choices(range(n), cum_weights=cum_weights, k=k)]
+
+    return pick
+
+def weighted_picker(rng: random.Random, weights: dict):
+    choices = list(weights)
+    cum_weights = list(accumulate(weights.values()))
+    return lambda: rng.choices(choices, cum_weights=cum_weights)[0]
+
+def random_date(rng: random.Random, days: int = HISTORY_DAYS) -> datetime:
+    return BASE_DATE - timedelta(seconds=rng.randrange(days * 86400))
+
+def to_decimal(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+def customer_id(n: int) -> str:
+    return f"CUST{n:07d}"
+
+def product_id(n: int) -> str:
+    return f"PRD-{n:06d}"
+
+def order_id(n: int) -> str:
+    return f"ORD{n:09d}"
+
+def generate_customers(rng: random.Random, count: int):
+    pick_tier = weighted_picker(rng, LOYALTY_WEIGHTS)
+    for n in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        yield {
+            "customer_id": customer_id(n),
+            "name": f"{first} {last}",
+            "email": f"{first.lower()}.{last.lower()}.{n}@example.com",
+            "phone": f"+1-555-{rng.randrange(10_000_000):07d}",
+            "registration_date": random_date(rng),
+            "loyalty_tier": pick_tier()
+        }
+
+def generate_products(rng: random.Random, count: int, prices: list[int]):
+    for n in range(count):
+        category = rng.choice(CATEGORIES)
+        price_cents = int(rng.lognormvariate(10.2, 1.0)) + 499
+        prices.append(price_cents)
+        yield {
+            "product_id": product_id(n),
+            "product_name": f"{category[:-1] if category.endswith('s') else category} {rng.choice(ADJECTIVES)} {n}",
+            "description": f"{rng.choice(ADJECTIVES)} series item from the {category.lower()} range, model {n}.",
+            "price": to_decimal(price_cents),
+            "stock_quantity": rng.randrange(0, 5000),
+            "category": category,
+            "specifications": {"warranty_months": rng.choice([12, 24, 36]), "weight_g": rng.randrange(50, 5000)},
+            "created_at": random_date(rng)
+        }
+
+def generate_issues(rng: random.Random, count: int, pick_products):
+    pick_severity = weighted_picker(rng, SEVERITY_WEIGHTS)
+    product_indexes = pick_products(count)
+    for n in range(count):
+        title = rng.choice(ISSUE_TITLES)
+        yield {
+            "issue_id": n + 1,
+            "product_id": product_id(product_indexes[n]),
+            "issue_title": title,
+            "description": f"Customers report: {title.lower()}.",
+            "solution": "Restart the device, install the latest firmware and contact support if the issue persists.",
+            "severity": pick_severity(),
+            "created_at": random_date(rng)
+        }
+
+def generate_orders(rng: random.Random, count: int, batch_size: int, prices: list[int], pick_customers, pick_products):
+    pick_status = weighted_picker(rng, STATUS_WEIGHTS)
+    sizes = range(1, len(ITEMS_PER_ORDER_WEIGHTS) + 1)
+    size_cum_weights = list(accumulate(ITEMS_PER_ORDER_WEIGHTS))
+    item_id = 0
+
+    for start in range(0, count, batch_size):
+        batch_count = min(batch_size, count - start)
+        customer_indexes = pick_customers(batch_count)
+        item_counts = rng.choices(sizes, cum_weights=size_cum_weights, k=batch_count)
+        product_indexes = iter(pick_products(sum(item_counts)))
+        orders, items, logs = [], [], []
+
+        for offset in range(batch_count):
+            n = start + offset
+            status = pick_status()
+            order_date = random_date(rng)
+            total_cents = 0
+
+            for _ in range(item_counts[offset]):
+                product_index = next(product_indexes)
+                quantity = 1 if rng.random() < 0.8 else rng.randrange(2, 6)
+                total_cents += prices[product_index] * quantity
+                item_id += 1
+                items.append({
+                    "item_id": item_id,
+                    "order_id": order_id(n),
+                    "product_id": product_id(product_index),
+                    "quantity": quantity,
+                    "price": to_decimal(prices[product_index])
+                })
+
+            orders.append({
+                "order_id": order_id(n),
+                "customer_id": customer_id(customer_indexes[offset]),
+                "order_date": order_date,
+                "status": status,
+                "total_amount": to_decimal(total_cents),
+                "shipping_address": f"{rng.randrange(1, 9999)} Main St, Springfield",
+                "tracking_number": f"TRK{n:012d}" if status in (OrderStatus.shipped, OrderStatus.delivered) else None
+            })
+            logs.append({
+                "log_id": n + 1,
+                "order_id": order_id(n),
+                "status": status.value,
+                "notes": "Generated order",
+                "timestamp": order_date
+            })
+
+        yield orders, items, logs
+
+def batched(rows, size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def configure_bulk_connections(engine):
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if engine.dialect.name == "sqlite":
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=OFF")
+        elif engine.dialect.name == "mysql":
+            cursor.execute("SET foreign_key_checks=0")
+            cursor.execute("SET unique_checks=0")
+        cursor.close()
+
+class BulkLoader:
+    def __init__(self, engine, batch_size: int):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.counts = {}
+
+    def insert(self, connection, model, rows: list[dict]):
+        if rows:
+            connection.execute(model.__table__.insert(), rows)
+            self.counts[model.__tablename__] = self.counts.get(model.__tablename__, 0) + len(rows)
+
+    def load(self, model, rows):
+        started = time.perf_counter()
+        for batch in batched(rows, self.batch_size):
+            with self.engine.begin() as connection:
+                self.insert(connection, model, batch)
+        self.report(model.__tablename__, started)
+
+    def load_orders(self, batches):
+        started = time.perf_counter()
+        for orders, items, logs in batches:
+            with self.engine.begin() as connection:
+                self.insert(connection, Order, orders)
+                self.insert(connection, OrderItem, items)
+                self.insert(connection, OrderLog, logs)
+        for table in (Order, OrderItem, OrderLog):
+            self.report(table.__tablename__, started)
+
+    def report(self, table: str, started: float):
+        count = self.counts.get(table, 0)
+        elapsed = time.perf_counter() - started
+        print(f"{table}: {count:,} rows in {elapsed:.1f}s ({count / max(elapsed, 1e-9):,.0f} rows/s)")
+
+def build_dataset(engine, customers: int, products: int, orders: int, issues: int, seed: int, batch_size: int, customer_skew: float, product_skew: float):
+    rng = random.Random(seed)
+    loader = BulkLoader(engine, batch_size)
+    prices = []
+
+    loader.load(Customer, generate_customers(rng, customers))
+    loader.load(Product, generate_products(rng, products, prices))
+
+    pick_customers = skewed_picker(rng, customers, customer_skew)
+    pick_products = skewed_picker(rng, products, product_skew)
+
+    loader.load(TechnicalIssue, generate_issues(rng, issues, pick_products))
+    loader.load_orders(generate_orders(rng, orders, batch_size, prices, pick_customers, pick_products))
+
+    started = time.perf_counter()
+    with SessionLocal() as session:
+        loader.counts[CustomerOrderSummary.__tablename__] = OrderSummaryRepository(session).rebuild()
+        session.commit()
+    loader.report(CustomerOrderSummary.__tablename__, started)
+
+    return loader.counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic dataset and bulk load it into the database.")
+    parser.add_argument("--database-url", help="Target database URL (overrides DATABASE_URL and the DB_* settings)")
+    parser.add_argument("--customers", type=int, default=10_000)
+    parser.add_argument("--products", type=int, default=1_000)
+    parser.add_argument("--orders", type=int, default=50_000, help="Orders to generate (~2.1 items per order on average)")
+    parser.add_argument("--issues", type=int, help="Technical issues to generate (defaults to products / 10)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--customer-skew", type=float, default=0.8, help="Zipf exponent for orders per customer")
+    parser.add_argument("--product-skew", type=float, default=1.1, help="Zipf exponent for product popularity")
+    parser.add_argument("--drop", action="store_true", help="Drop and recreate all tables before loading")
+    args = parser.parse_args()
+
+    if args.customers < 1 or args.products < 1:
+        parser.error("--customers and --products must be at least 1")
+
+    engine = create_engine(DATABASE_URL)
+    configure_bulk_connections(engine)
+
+    if args.drop:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with engine.connect() as connection:
+        if connection.execute(text("SELECT 1 FROM customers LIMIT 1")).first():
+            parser.error("target database already contains data, rerun with --drop to rebuild it")
+
+    started = time.perf_counter()
+    build_dataset(
+        engine,
+        customers=args.customers,
+        products=args.products,
+        orders=args.orders,
+        issues=args.issues if args.issues is not None else args.products // 10,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        customer_skew=args.customer_skew,
+        product_skew=args.product_skew
+    )
+    engine.dispose()
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from core.database import engine, get_db_session
+from core.models import CustomerOrderSummary
+from core.repositories.order_summary_repository import OrderSummaryRepository
+
+def main():
+    started = time.perf_counter()
+    CustomerOrderSummary.__table__.create(engine, checkfirst=True)
+    
+    with get_db_session() as session:
+        count = OrderSummaryRepository(session).rebuild()
+        session.commit()
+    
+    print(f"Rebuilt {count:,} customer order summaries in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
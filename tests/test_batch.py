@@ -0,0 +1,25 @@
+import json
+from batch import load_checkpoint, iter_tickets
+
+def test_checkpoint_keeps_latest_record_per_ticket(tmp_path):
+    output = tmp_path / "results.jsonl"
+    output.write_text(
+        '{"ticket_id": "a", "error": "timeout"}\n'
+        '{"ticket_id": "b"}\n'
+        '{"ticket_id": "x", "resp\n'
+        '[1]\n'
+        '{"ticket_id": "a"}\n'
+        '{"ticket_id": "c", "error": "timeout"}\n'
+        '{"ticket_id": "d"'
+    )
+
+    assert load_checkpoint(output) == {"a", "b"}
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r["ticket_id"] for r in records] == ["b", "a", "c"]
+    assert "error" not in records[1]
+
+def test_iter_tickets_skips_invalid_lines(tmp_path):
+    source = tmp_path / "tickets.jsonl"
+    source.write_text('[1]\nnot json\n{"ticket_id": "t1"}\n{"query": "Where is my order?"}\n')
+
+    assert list(iter_tickets(source)) == [{"query": "Where is my order?", "ticket_id": "tickets.jsonl:4"}]
@@ -0,0 +1,68 @@
+import os
+import time
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from core.database import ReplicaRouter
+
+@pytest.fixture
+def engines(tmp_path):
+    engines = []
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE marker (name TEXT)"))
+            connection.execute(text("INSERT INTO marker VALUES (:name)"), {"name": name})
+        engines.append(engine)
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+def make_router(engines, max_lag: float = 5, lag_check_interval: float = 5, check_lag: bool = True) -> ReplicaRouter:
+    primary, replica = engines
+    router = ReplicaRouter(primary, [replica], max_lag, lag_check_interval)
+    # Keep the background lag monitor from overwriting lag values set by the tests.
+    router.monitor_pid = os.getpid()
+    if check_lag:
+        router.check_lag()
+    return router
+
+def read_marker(engine) -> str:
+    with Session(bind=engine) as session:
+        return session.execute(text("SELECT name FROM marker")).scalar_one()
+
+def test_read_only_sessions_use_replica(engines):
+    router = make_router(engines)
+
+    assert read_marker(router.choose()) == "replica"
+    metrics = router.snapshot()
+    assert metrics["engines"]["replica-0"]["queries"] >= 1
+    assert metrics["engines"]["replica-0"]["lag"] == 0.0
+    assert metrics["fallbacks"] == {"read_your_writes": 0, "replica_lag": 0, "lag_unknown": 0}
+
+def test_recent_writes_read_from_primary_until_window_ends(engines):
+    router = make_router(engines, max_lag=0.1, lag_check_interval=0.1)
+    router.record_writes("CUST001", "ORD123ABC")
+
+    assert read_marker(router.choose(("ORD123ABC",))) == "primary"
+    assert read_marker(router.choose(("CUST002",))) == "replica"
+    assert router.fallbacks["read_your_writes"] == 1
+
+    time.sleep(router.write_window + 0.05)
+    assert read_marker(router.choose(("ORD123ABC",))) == "replica"
+
+@pytest.mark.parametrize("lag", [None, 10.0])
+def test_unhealthy_replica_falls_back_to_primary(engines, lag):
+    router = make_router(engines, max_lag=5)
+    router.metrics[engines[1]].lag = lag
+
+    assert read_marker(router.choose()) == "primary"
+    assert router.fallbacks["replica_lag"] == 1
+    assert router.fallbacks["lag_unknown"] == 0
+
+def test_unmeasured_replica_is_counted_separately(engines):
+    router = make_router(engines, check_lag=False)
+
+    assert router.choose() is engines[0]
+    assert router.fallbacks["lag_unknown"] == 1
+    assert router.fallbacks["replica_lag"] == 0
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from core.database import Base
+from core.models import Customer, Product, Order, OrderStatus, CustomerOrderSummary
+from core.repositories.order_summary_repository import OrderSummaryRepository, SUMMARY_COLUMNS
+from core.services.order_service import OrderService
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Customer(customer_id="CUST001", name="Ada", email="ada@example.com"),
+        Customer(customer_id="CUST002", name="Bob", email="bob@example.com"),
+        Product(product_id="LP-5000", product_name="Laptop", price=999.99, stock_quantity=100),
+        Product(product_id="MS-100", product_name="Mouse", price=19.50, stock_quantity=100)
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def snapshot(session) -> dict:
+    session.expire_all()
+    rows = {}
+    for summary in session.query(CustomerOrderSummary).all():
+        row = {column: getattr(summary, column) for column in SUMMARY_COLUMNS}
+        row["lifetime_spend"] = round(float(row["lifetime_spend"]), 2)
+        rows[summary.customer_id] = row
+    return rows
+
+def incremental_and_rebuilt(session) -> tuple[dict, dict]:
+    incremental = snapshot(session)
+    OrderSummaryRepository(session).rebuild()
+    session.commit()
+    return incremental, snapshot(session)
+
+def test_incremental_updates_match_rebuild(session):
+    service = OrderService(session)
+    placed = [
+        service.place_order("CUST001", [{"product_id": "LP-5000", "quantity": 1}], "1 Main St"),
+        service.place_order("CUST001", [{"product_id": "MS-100", "quantity": 3}], "1 Main St"),
+        service.place_order("CUST002", [{"product_id": "MS-100", "quantity": 1}], "2 Main St")
+    ]
+    assert all(result.get("success") for result in placed)
+
+    service.update_order_status(placed[0]["order_id"], "shipped")
+    service.update_order_status(placed[0]["order_id"], "delivered")
+    service.update_order_status(placed[1]["order_id"], "cancelled")
+    service.update_order_status(placed[1]["order_id"], "processing")
+    service.update_order_status(placed[2]["order_id"], "cancelled")
+
+    tied_at = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    summary_repo = OrderSummaryRepository(session)
+    for order_id in ("ORDFFF001", "ORDAAA001"):
+        order = Order(order_id=order_id, customer_id="CUST002", order_date=tied_at, status=OrderStatus.pending, total_amount=5)
+        session.add(order)
+        session.flush()
+        summary_repo.record_order(order)
+    session.commit()
+
+    incremental, rebuilt = incremental_and_rebuilt(session)
+    assert incremental == rebuilt
+
+    summary = service.get_customer_order_summary("CUST001")
+    assert summary["order_count"] == 2
+    assert summary["orders_by_status"]["delivered"] == 1
+    assert summary["lifetime_spend"] == pytest.approx(999.99 + 3 * 19.50)
+    assert service.get_customer_order_summary("CUST002")["last_order"]["order_id"] == "ORDFFF001"
+
+def test_missing_summary_is_seeded_from_existing_orders(session):
+    now = datetime.now()
+    session.add_all([
+        Order(order_id=f"ORDOLD{n}", customer_id="CUST001", order_date=now - timedelta(days=n + 1), status=OrderStatus.delivered, total_amount=10)
+        for n in range(3)
+    ])
+    session.commit()
+
+    service = OrderService(session)
+    service.update_order_status("ORDOLD0", "cancelled")
+    service.place_order("CUST001", [{"product_id": "MS-100", "quantity": 1}], "1 Main St")
+
+    incremental, rebuilt = incremental_and_rebuilt(session)
+    assert incremental == rebuilt
+    assert service.get_customer_order_summary("CUST001")["order_count"] == 4
+
+def test_summary_without_row_is_computed_from_orders(session):
+    session.add(Order(order_id="ORDOLD1", customer_id="CUST001", order_date=datetime.now(), status=OrderStatus.shipped, total_amount=25))
+    session.commit()
+
+    service = OrderService(session)
+    summary = service.get_customer_order_summary("CUST001")
+    assert summary["order_count"] == 1
+    assert summary["orders_by_status"]["shipped"] == 1
+    assert summary["last_order"]["order_id"] == "ORDOLD1"
+    assert service.get_customer_order_summary("CUST002")["order_count"] == 0
+    assert service.get_customer_order_summary("CUST999") is None